@@ -6,6 +6,7 @@ from discord.ext import commands, tasks
 from dotenv import load_dotenv
 from datetime import datetime, timedelta, timezone
 import random 
+import uuid
 
 from deep_translator import GoogleTranslator
 from instagrapi.types import Media
@@ -13,16 +14,14 @@ from instagrapi.types import Media
 import config
 from core.database_manager import DatabaseManager
 from core.instagram_checker import InstagramChecker
+from core.log_manager import setup_logging, log_context, flush_sampled
 
 load_dotenv()
 os.makedirs(os.path.dirname(config.DATABASE_PATH), exist_ok=True)
 os.makedirs(os.path.dirname(config.LOG_FILE_PATH), exist_ok=True)
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler(config.LOG_FILE_PATH, encoding='utf-8'),
-                        logging.StreamHandler()
-                    ])
+setup_logging(config.LOG_FILE_PATH, config.LOG_MAX_BYTES, config.LOG_BACKUP_COUNT,
+              config.LOG_SAMPLE_BURST, config.LOG_SAMPLE_WINDOW_SECONDS)
 
 class InstagramNotifierBot(commands.Bot):
     def __init__(self):
@@ -39,7 +38,7 @@ class InstagramNotifierBot(commands.Bot):
         logging.info("Slash commands synced.") 
 
     async def on_ready(self):
-        logging.info(f'Logged in as {self.user}')
+        logging.info("Logged in as %s", self.user)
         instagram_check_loop.start()
 
     def format_with_placeholders(self, text: str, media: Media, caption_override: str = None) -> str:
@@ -160,44 +159,62 @@ bot = InstagramNotifierBot()
 
 @tasks.loop(seconds=config.CHECK_INTERVAL_SECONDS)
 async def instagram_check_loop():
+    with log_context(cycle_id=uuid.uuid4().hex[:12]):
+        try:
+            await run_check_cycle()
+        finally:
+            flush_sampled()
+
+async def run_check_cycle():
     logging.info("Starting check cycle...")
     unique_usernames = bot.db_manager.get_unique_tracked_usernames()
     if not unique_usernames: return
 
     for raw_username in unique_usernames:
         username = raw_username.lstrip('@')
-        try:
-            new_medias = await asyncio.to_thread(bot.instagram_checker.get_new_posts, username, 10)
-
-            new_medias.sort(key=lambda x: x.taken_at, reverse=True)
-
-            for media in new_medias:
-            
-                if bot.db_manager.is_media_sent(media.code): continue
+        with log_context(username=username):
+            try:
+                new_medias = await asyncio.to_thread(bot.instagram_checker.get_new_posts, username, 10)
 
-                now_utc = datetime.now(timezone.utc)
-                post_time = media.taken_at.astimezone(timezone.utc)
-                
-                time_diff = (now_utc - post_time).total_seconds()
-                
-                if time_diff > 86400: 
-                    logging.info(f"Skipping OLD media (Silent Save): {media.code} | Age: {time_diff/3600:.1f}h")
-                    bot.db_manager.mark_media_as_sent(media.code)
-                    continue
+                new_medias.sort(key=lambda x: x.taken_at, reverse=True)
 
-                logging.info(f"New media found: {media.code}")
-                target_channels = bot.db_manager.get_channels_for_username(raw_username)
+                for media in new_medias:
                 
-                for ch_id in target_channels:
-                    channel = bot.get_channel(ch_id)
-                    if channel: await bot.send_notification(channel, media)
-                
-                bot.db_manager.mark_media_as_sent(media.code)
-                await asyncio.sleep(random.uniform(5, 10))
-
-        except Exception as e:
-            logging.error(f"Check failed for {username}: {e}")
-            await asyncio.sleep(5)
+                    if bot.db_manager.is_media_sent(media.code): continue
+
+                    now_utc = datetime.now(timezone.utc)
+                    post_time = media.taken_at.astimezone(timezone.utc)
+                    
+                    time_diff = (now_utc - post_time).total_seconds()
+
+                    with log_context(media_code=media.code):
+                        if time_diff > 86400: 
+                            logging.info("Skipping OLD media (Silent Save): %s | Age: %.1fh", media.code, time_diff / 3600,
+                                         extra={"sampled": True})
+                            bot.db_manager.mark_media_as_sent(media.code)
+                            continue
+
+                        logging.info("New media found: %s", media.code)
+                        target_channels = bot.db_manager.get_channels_for_username(raw_username)
+                        
+                        for ch_id in target_channels:
+                            channel = bot.get_channel(ch_id)
+                            if not channel: continue
+                            with log_context(channel_id=ch_id):
+                                try:
+                                    await bot.send_notification(channel, media)
+                                    logging.info("Notification sent for %s", media.code)
+                                except Exception as e:
+                                    logging.error("Notification failed for %s in channel %s: %s", media.code, ch_id, e,
+                                                  exc_info=True)
+                                    raise
+                        
+                        bot.db_manager.mark_media_as_sent(media.code)
+                    await asyncio.sleep(random.uniform(5, 10))
+
+            except Exception as e:
+                logging.error("Check failed for %s: %s", username, e)
+                await asyncio.sleep(5)
 
     logging.info("Cycle finished.")
 
@@ -93,7 +93,7 @@ class ManagementCog(commands.Cog):
             await interaction.followup.send(f"✅ Fetched latest post for `{username}`.", ephemeral=True)
 
         except Exception as e:
-            logging.error(f"Manual fetch failed: {e}")
+            logging.error("Manual fetch failed: %s", e)
             await interaction.followup.send(f"❌ Error fetching post: {e}", ephemeral=True)
 
 async def setup(bot: commands.Bot):
@@ -13,6 +13,12 @@ PRESENCE_MESSAGE = "QWER"
 
 DATABASE_PATH = "data/bot_database.db"
 LOG_FILE_PATH = "logs/bot.log"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# Repetitive per-media lines: at most LOG_SAMPLE_BURST per LOG_SAMPLE_WINDOW_SECONDS
+LOG_SAMPLE_BURST = 5
+LOG_SAMPLE_WINDOW_SECONDS = 60
 
 
 DELAY_BETWEEN_USERS = (20, 60)
\ No newline at end of file
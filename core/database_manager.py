@@ -7,7 +7,7 @@ import os
 class DatabaseManager:
     def __init__(self, db_path: str):
         self.db_path = os.path.abspath(db_path)
-        logging.info(f"Database manager initialized. Database file path: {self.db_path}")
+        logging.info("Database manager initialized. Database file path: %s", self.db_path)
         self._create_tables()
         self._migrate_tables()
 
@@ -68,9 +68,9 @@ class DatabaseManager:
             if col_name not in existing_columns:
                 try:
                     cursor.execute(f"ALTER TABLE tracked_accounts ADD COLUMN {col_name} {col_type}")
-                    logging.info(f"Migrated DB: Added column '{col_name}' to tracked_accounts.")
+                    logging.info("Migrated DB: Added column '%s' to tracked_accounts.", col_name)
                 except Exception as e:
-                    logging.warning(f"Migration warning for {col_name}: {e}")
+                    logging.warning("Migration warning for %s: %s", col_name, e)
         
         conn.commit()
         conn.close()
@@ -85,10 +85,10 @@ class DatabaseManager:
                 (username, channel_id, role_id)
             )
             conn.commit()
-            logging.info(f"SUCCESSFULLY WROTE to DB: Account '{username}' to Channel {channel_id} (Role: {role_id}).")
+            logging.info("SUCCESSFULLY WROTE to DB: Account '%s' to Channel %s (Role: %s).", username, channel_id, role_id)
             return True
         except sqlite3.IntegrityError:
-            logging.warning(f"Mapping already exists for Account '{username}' in Channel ID {channel_id}.")
+            logging.warning("Mapping already exists for Account '%s' in Channel ID %s.", username, channel_id)
             return False
         finally:
             conn.close()
@@ -113,7 +113,7 @@ class DatabaseManager:
         cursor.execute(f"UPDATE tracked_accounts SET {key} = ? WHERE username = ? AND channel_id = ?", (value, username, channel_id))
         conn.commit()
         conn.close()
-        logging.info(f"Updated setting '{key}' for user {username} in channel {channel_id}.")
+        logging.info("Updated setting '%s' for user %s in channel %s.", key, username, channel_id)
 
 
     def remove_account(self, username: str, channel_id: int) -> bool:
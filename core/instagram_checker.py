@@ -16,14 +16,14 @@ class InstagramChecker:
             try:
                 self.cl.load_settings(session_file)
             except Exception as e:
-                logging.warning(f"Could not load session: {e}")
+                logging.warning("Could not load session: %s", e)
         
         self._login()
 
     def _login(self):
         try:
             self.cl.get_timeline_feed()
-            logging.info(f"Session valid for {self.username}.")
+            logging.info("Session valid for %s.", self.username)
         except (LoginRequired, Exception):
             logging.info("Logging in with password...")
             try:
@@ -31,14 +31,14 @@ class InstagramChecker:
                 self.cl.dump_settings(f"session_{self.username}.json")
                 logging.info("Login successful.")
             except Exception as e:
-                logging.critical(f"Login failed: {e}")
+                logging.critical("Login failed: %s", e)
                 raise e
 
     def get_user_id(self, username: str):
         try:
             return self.cl.user_info_by_username_v1(username).pk
         except Exception as e:
-            logging.error(f"Failed to get User ID for {username}: {e}")
+            logging.error("Failed to get User ID for %s: %s", username, e)
             return None
 
     def get_new_posts(self, username: str, amount=10):
@@ -57,5 +57,5 @@ class InstagramChecker:
             return list(combined_medias.values())
 
         except Exception as e:
-            logging.error(f"Error fetching media for {username}: {e}")
+            logging.error("Error fetching media for %s: %s", username, e)
             return []
\ No newline at end of file
@@ -0,0 +1,198 @@
+# core/log_manager.py
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+CONTEXT_FIELDS = ("cycle_id", "username", "media_code", "channel_id")
+_context_vars = {name: contextvars.ContextVar(name, default=None) for name in CONTEXT_FIELDS}
+
+_listener = None
+_queue_handler = None
+_sampling_filter = None
+_traceback_formatter = logging.Formatter()
+
+
+@contextmanager
+def log_context(**fields):
+    """Attach correlation fields to every record logged inside this block."""
+    tokens = []
+    for name, value in fields.items():
+        if name not in _context_vars:
+            raise ValueError(f"Unknown log context field: {name}")
+        tokens.append((_context_vars[name], _context_vars[name].set(value)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copy the current correlation fields onto the record in the caller's context."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for name, var in _context_vars.items():
+            if not hasattr(record, name):
+                setattr(record, name, var.get())
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Rate-limit records logged with extra={"sampled": True}.
+
+    Allows `burst` records per message template every `window` seconds; the
+    number of dropped records is reported on the next one that gets through,
+    or by `flush()` if none does.
+    """
+
+    def __init__(self, burst: int, window: float):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sampled", False):
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            start, count, suppressed = self._buckets.get(record.msg, (now, 0, 0))
+            if now - start >= self.window:
+                start, count = now, 0
+            if count >= self.burst:
+                self._buckets[record.msg] = (start, count, suppressed + 1)
+                return False
+            self._buckets[record.msg] = (start, count + 1, 0)
+
+        record.suppressed = suppressed
+        return True
+
+    def flush(self) -> list[tuple[str, int]]:
+        """Return and clear the pending dropped-record counts per template."""
+        pending = []
+        with self._lock:
+            for template, (start, count, suppressed) in self._buckets.items():
+                if suppressed:
+                    pending.append((template, suppressed))
+                    self._buckets[template] = (start, count, 0)
+        return pending
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps the traceback out of the message.
+
+    The stock `prepare()` formats the whole record and folds the traceback
+    into `msg`. Here only the args are merged and the traceback is rendered
+    into `exc_text`, leaving final formatting to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _traceback_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with correlation fields when they are set."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for name in CONTEXT_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        if getattr(record, "suppressed", 0):
+            entry["suppressed"] = record.suppressed
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def setup_logging(log_file_path: str, max_bytes: int, backup_count: int,
+                  sample_burst: int, sample_window: float, level: int = logging.INFO):
+    """Route all logging through a queue drained by a background thread.
+
+    The event loop only merges the message args (and renders the traceback,
+    if any) before enqueueing; JSON formatting, rotation and disk writes
+    happen on the listener thread.
+    """
+    global _listener, _queue_handler, _sampling_filter
+    if _listener is not None:
+        return
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file_path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+    )
+    file_handler.setFormatter(JsonFormatter())
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    _sampling_filter = SamplingFilter(sample_burst, sample_window)
+    _queue_handler = StructuredQueueHandler(queue.SimpleQueue())
+    _queue_handler.addFilter(_sampling_filter)
+    _queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+
+    _listener = logging.handlers.QueueListener(
+        _queue_handler.queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def flush_sampled():
+    """Log a summary for every template that still has dropped records pending."""
+    if _sampling_filter is None:
+        return
+    for template, suppressed in _sampling_filter.flush():
+        logging.info("Suppressed %d repeated log lines: %s", suppressed, template,
+                     extra={"suppressed": suppressed})
+
+
+def stop_logging():
+    """Flush pending records and stop the listener thread.
+
+    The listener's handlers are attached directly to the root logger so that
+    records logged during shutdown are still written.
+    """
+    global _listener, _queue_handler, _sampling_filter
+    if _listener is None:
+        return
+    flush_sampled()
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+    _listener = None
+    _queue_handler = None
+    _sampling_filter = None
+
@@ -0,0 +1,128 @@
+import json
+import logging
+import sys
+
+import pytest
+
+from core import log_manager
+from core.log_manager import ContextFilter, JsonFormatter, SamplingFilter, StructuredQueueHandler, log_context
+
+
+def make_record(msg="Skipping %s", args=("abc",), sampled=True, exc_info=None):
+    record = logging.LogRecord("root", logging.INFO, __file__, 1, msg, args, exc_info)
+    if sampled:
+        record.sampled = True
+    return record
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(log_manager.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_sampling_filter_burst_window_and_suppressed(clock):
+    sampler = SamplingFilter(burst=2, window=60)
+
+    assert [sampler.filter(make_record()) for _ in range(5)] == [True, True, False, False, False]
+
+    clock[0] += 60
+    record = make_record()
+    assert sampler.filter(record)
+    assert record.suppressed == 3
+
+    record = make_record()
+    assert sampler.filter(record)
+    assert record.suppressed == 0
+    assert not sampler.filter(make_record())
+
+
+def test_sampling_filter_ignores_unsampled_records(clock):
+    sampler = SamplingFilter(burst=1, window=60)
+    assert all(sampler.filter(make_record(sampled=False)) for _ in range(5))
+
+
+def test_sampling_filter_flush_returns_pending_counts(clock):
+    sampler = SamplingFilter(burst=1, window=60)
+    for _ in range(4):
+        sampler.filter(make_record())
+    sampler.filter(make_record(msg="Other %s"))
+
+    assert sampler.flush() == [("Skipping %s", 3)]
+    assert sampler.flush() == []
+
+
+def test_log_context_nesting_and_reset():
+    context_filter = ContextFilter()
+
+    with log_context(cycle_id="c1", username="alice"):
+        with log_context(username="bob", media_code="M1"):
+            record = make_record(sampled=False)
+            context_filter.filter(record)
+            assert (record.cycle_id, record.username, record.media_code) == ("c1", "bob", "M1")
+
+        record = make_record(sampled=False)
+        context_filter.filter(record)
+        assert (record.cycle_id, record.username, record.media_code) == ("c1", "alice", None)
+
+    record = make_record(sampled=False)
+    context_filter.filter(record)
+    assert record.cycle_id is None and record.username is None
+
+
+def test_log_context_rejects_unknown_field():
+    with pytest.raises(ValueError):
+        with log_context(guild_id=1):
+            pass
+
+
+def test_json_formatter_fields():
+    record = make_record(sampled=False)
+    record.cycle_id, record.username, record.media_code, record.channel_id = "c1", "alice", "M1", None
+    record.suppressed = 2
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["msg"] == "Skipping abc"
+    assert entry["level"] == "INFO"
+    assert entry["suppressed"] == 2
+    assert (entry["cycle_id"], entry["username"], entry["media_code"]) == ("c1", "alice", "M1")
+    assert "channel_id" not in entry
+    assert "exc" not in entry
+
+
+def test_queued_exception_keeps_traceback_out_of_msg():
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = make_record(msg="Send failed for %s", args=("M1",), sampled=False, exc_info=sys.exc_info())
+
+    prepared = StructuredQueueHandler(None).prepare(record)
+    entry = json.loads(JsonFormatter().format(prepared))
+
+    assert entry["msg"] == "Send failed for M1"
+    assert "RuntimeError: boom" in entry["exc"]
+
+
+def test_stop_logging_keeps_writing_after_listener_stops(tmp_path):
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    log_file = tmp_path / "bot.log"
+    try:
+        log_manager.setup_logging(str(log_file), 10000, 1, 5, 60)
+        log_manager.stop_logging()
+
+        assert not any(isinstance(h, StructuredQueueHandler) for h in root.handlers)
+        logging.info("after shutdown")
+        for handler in root.handlers:
+            handler.flush()
+
+        assert "after shutdown" in log_file.read_text(encoding="utf-8")
+    finally:
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)